@@ -0,0 +1,28 @@
+"""Add keyset pagination indexes
+
+Revision ID: 3f2c8d1e7a4b
+Revises: b5a9ae9dc438
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2c8d1e7a4b'
+down_revision: Union[str, None] = 'b5a9ae9dc438'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_profiles_updated_at_id', 'profiles', [sa.text('updated_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_founder_events_detected_at_id', 'founder_events', [sa.text('detected_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_founder_events_detected_at_id', table_name='founder_events')
+    op.drop_index('ix_profiles_updated_at_id', table_name='profiles')
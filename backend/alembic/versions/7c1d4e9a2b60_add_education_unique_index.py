@@ -0,0 +1,32 @@
+"""Add unique index on education for ingestion upserts
+
+Revision ID: 7c1d4e9a2b60
+Revises: 3f2c8d1e7a4b
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d4e9a2b60'
+down_revision: Union[str, None] = '3f2c8d1e7a4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # COALESCE so rows with an unknown graduation year are deduplicated too
+    op.create_index(
+        'uq_education_profile_institution_year',
+        'education',
+        ['profile_id', 'institution', sa.text('COALESCE(graduation_year, -1)')],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_education_profile_institution_year', table_name='education')
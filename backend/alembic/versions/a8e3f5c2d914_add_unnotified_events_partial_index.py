@@ -0,0 +1,32 @@
+"""Add partial index on unnotified founder events
+
+Revision ID: a8e3f5c2d914
+Revises: 7c1d4e9a2b60
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e3f5c2d914'
+down_revision: Union[str, None] = '7c1d4e9a2b60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_founder_events_unnotified', 'founder_events',
+        [sa.text('detected_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('notified = false'),
+        sqlite_where=sa.text('notified = 0'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_founder_events_unnotified', table_name='founder_events')
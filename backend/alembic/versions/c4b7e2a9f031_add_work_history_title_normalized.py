@@ -0,0 +1,60 @@
+"""Add normalized title column to work_history
+
+Revision ID: c4b7e2a9f031
+Revises: a8e3f5c2d914
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b7e2a9f031'
+down_revision: Union[str, None] = 'a8e3f5c2d914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows updated per executemany round-trip during the backfill
+BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copy of app.models.work_history.normalize_title at this revision;
+# done in Python because SQL LOWER/TRIM differ from str.lower/str.strip for
+# tabs, newlines and non-ASCII text
+_TITLE_TRANS = str.maketrans({"-": " ", "/": " "})
+
+
+def _normalize_title(title):
+    if not title:
+        return ""
+    return title.lower().translate(_TITLE_TRANS).strip()
+
+
+def upgrade() -> None:
+    op.add_column('work_history', sa.Column('title_normalized', sa.String(), nullable=True))
+    
+    # Backfill with exactly the normalization the @validates hook applies
+    conn = op.get_bind()
+    work_history = sa.table(
+        'work_history',
+        sa.column('id', sa.Integer),
+        sa.column('title', sa.String),
+        sa.column('title_normalized', sa.String),
+    )
+    rows = conn.execute(sa.select(work_history.c.id, work_history.c.title)).all()
+    update = (
+        sa.update(work_history)
+        .where(work_history.c.id == sa.bindparam('row_id'))
+        .values(title_normalized=sa.bindparam('normalized'))
+    )
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        conn.execute(update, [
+            {'row_id': row_id, 'normalized': _normalize_title(title)}
+            for row_id, title in rows[start:start + BACKFILL_BATCH_SIZE]
+        ])
+
+
+def downgrade() -> None:
+    op.drop_column('work_history', 'title_normalized')
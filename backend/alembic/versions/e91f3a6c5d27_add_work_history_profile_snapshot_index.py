@@ -0,0 +1,37 @@
+"""Add composite work history and founder event lookup indexes
+
+Revision ID: e91f3a6c5d27
+Revises: c4b7e2a9f031
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91f3a6c5d27'
+down_revision: Union[str, None] = 'c4b7e2a9f031'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_work_history_profile_snapshot', 'work_history', ['profile_id', sa.text('snapshot_date DESC')], unique=False)
+    op.drop_index('ix_work_history_snapshot_date', table_name='work_history')
+    op.drop_index('ix_work_history_profile_id', table_name='work_history')
+    op.create_index('ix_founder_event_profile_title', 'founder_events', ['profile_id', 'new_title'], unique=False)
+    # Covered by the leading columns of the composite indexes
+    op.drop_index('ix_founder_events_profile_id', table_name='founder_events')
+    op.drop_index('ix_founder_events_detected_at', table_name='founder_events')
+
+
+def downgrade() -> None:
+    op.create_index('ix_founder_events_detected_at', 'founder_events', ['detected_at'], unique=False)
+    op.create_index('ix_founder_events_profile_id', 'founder_events', ['profile_id'], unique=False)
+    op.drop_index('ix_founder_event_profile_title', table_name='founder_events')
+    op.create_index('ix_work_history_profile_id', 'work_history', ['profile_id'], unique=False)
+    op.create_index('ix_work_history_snapshot_date', 'work_history', ['snapshot_date'], unique=False)
+    op.drop_index('ix_work_history_profile_snapshot', table_name='work_history')
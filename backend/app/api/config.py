@@ -5,13 +5,14 @@ from app.database import get_db
 from app.auth import verify_credentials
 from app.models import TrackingMetadata
 from app.schemas.config import ConfigResponse, CompanyListRequest, StateListRequest
+from app.services.config_cache import get_tracking_config, invalidate_tracking_config
 
 
 router = APIRouter()
 
 
 @router.get("", response_model=ConfigResponse)
-async def get_config(
+def get_config(
     db: Session = Depends(get_db),
     username: str = Depends(verify_credentials),
 ):
@@ -25,7 +26,7 @@ async def get_config(
     Returns:
         Current configuration
     """
-    config = db.query(TrackingMetadata).first()
+    config = get_tracking_config(db)
     
     if not config:
         # Return default empty config
@@ -36,16 +37,11 @@ async def get_config(
             last_detection=None,
         )
     
-    return ConfigResponse(
-        target_companies=config.target_companies or [],
-        target_states=config.target_states or [],
-        last_ingestion=config.last_ingestion,
-        last_detection=config.last_detection,
-    )
+    return config
 
 
 @router.post("/companies")
-async def set_companies(
+def set_companies(
     request: CompanyListRequest,
     db: Session = Depends(get_db),
     username: str = Depends(verify_credentials),
@@ -73,6 +69,7 @@ async def set_companies(
         config.target_companies = request.companies
     
     db.commit()
+    invalidate_tracking_config()
     
     return {
         "message": "Companies updated",
@@ -82,7 +79,7 @@ async def set_companies(
 
 
 @router.patch("/states")
-async def set_states(
+def set_states(
     request: StateListRequest,
     db: Session = Depends(get_db),
     username: str = Depends(verify_credentials),
@@ -98,30 +95,33 @@ async def set_states(
     Returns:
         Success message
     """
-    # Validate state codes (basic validation - 2 uppercase letters)
+    # Validate and normalize state codes in one pass (2 letters, stored uppercase)
+    states = []
     for state in request.states:
         if len(state) != 2 or not state.isalpha():
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid state code: {state}. Must be 2-letter US state code (e.g., CA, NY)."
             )
+        states.append(state.upper())
     
     config = db.query(TrackingMetadata).first()
     
     if not config:
         config = TrackingMetadata(
             target_companies=[],
-            target_states=[s.upper() for s in request.states],
+            target_states=states,
         )
         db.add(config)
     else:
-        config.target_states = [s.upper() for s in request.states]
+        config.target_states = states
     
     db.commit()
+    invalidate_tracking_config()
     
     return {
         "message": "States updated",
-        "states": [s.upper() for s in request.states],
-        "count": len(request.states),
+        "states": states,
+        "count": len(states),
     }
 
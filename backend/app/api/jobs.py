@@ -1,12 +1,13 @@
 """Job execution API endpoints."""
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from datetime import datetime
 from app.database import get_db
 from app.auth import verify_credentials
 from app.services.detection.founder_detector import FounderDetector
 from app.services.notifications.factory import get_notifier
-from app.models import TrackingMetadata
+from app.services.config_cache import touch_last_run
+from app.services.count_cache import invalidate_counts
 
 
 router = APIRouter()
@@ -31,7 +32,7 @@ async def run_detection(
     """
     # Run detection
     detector = FounderDetector(db)
-    new_events = detector.detect_transitions()
+    new_events = await run_in_threadpool(detector.detect_transitions)
     
     # Send notifications for new events
     notified_count = 0
@@ -40,17 +41,13 @@ async def run_detection(
         success = await notifier.send_founder_digest(new_events)
         
         if success:
-            # Mark events as notified
-            for event in new_events:
-                event.notified = True
-            db.commit()
+            await run_in_threadpool(detector.mark_notified, [event.id for event in new_events])
             notified_count = len(new_events)
     
+    invalidate_counts()
+    
     # Update last detection timestamp
-    config = db.query(TrackingMetadata).first()
-    if config:
-        config.last_detection = datetime.now()
-        db.commit()
+    await run_in_threadpool(touch_last_run, db, "last_detection")
     
     return {
         "message": "Detection job completed",
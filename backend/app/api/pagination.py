@@ -0,0 +1,101 @@
+"""Keyset (cursor) pagination helpers shared by list endpoints."""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import and_, func, literal, or_
+from sqlalchemy.orm import Session
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+
+    Args:
+        sort_value: Value of the ORDER BY column (date or datetime)
+        row_id: Primary key of the row, used as a tiebreaker
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    payload = json.dumps([sort_value.isoformat(), row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(
+    cursor: str,
+    value_type: type = datetime,
+    id_type: type = str
+) -> Tuple[Any, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+        value_type: Type of the sort column (datetime or date)
+        id_type: Type of the primary key column (str or int)
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        raw_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        # bool is an int subclass but never a valid id
+        if not isinstance(row_id, id_type) or isinstance(row_id, bool):
+            raise TypeError(f"cursor id must be {id_type.__name__}")
+        return value_type.fromisoformat(raw_value), row_id
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def timestamp_key(db: Session, column, value: Any = None):
+    """
+    Get a timestamp column (or a cursor value for it) in comparable form.
+
+    SQLite stores server-side func.now() defaults as 'YYYY-MM-DD HH:MM:SS'
+    text while bound datetimes carry microseconds, so raw comparisons are
+    never equal within a second. On SQLite both sides are normalized with
+    datetime(); other dialects compare native timestamps unchanged.
+
+    Args:
+        db: Database session (used to detect the dialect)
+        column: Timestamp column
+        value: Cursor value to wrap instead of the column (optional)
+
+    Returns:
+        Column or bound value expression to sort and compare on
+    """
+    expr = column if value is None else literal(value, column.type)
+    if db.get_bind().dialect.name == "sqlite":
+        return func.datetime(expr)
+    return expr
+
+
+def keyset_filter(sort_column, id_column, cursor_value: Any, cursor_id: Any):
+    """
+    Build a `(sort_column, id) < (cursor_value, cursor_id)` condition.
+
+    Expanded into OR/AND form so it works on databases without row-value
+    comparison support.
+    """
+    return or_(
+        sort_column < cursor_value,
+        and_(sort_column == cursor_value, id_column < cursor_id),
+    )
+
+
+def next_cursor(rows: list, page_size: int, sort_attr: str) -> Optional[str]:
+    """
+    Build the cursor for the page following `rows`.
+
+    Returns:
+        Cursor string, or None if this was the last page
+    """
+    if len(rows) < page_size:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, sort_attr), last.id)
@@ -1,58 +1,103 @@
 """Profile-related API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
 from app.auth import verify_credentials
 from app.models import Profile
 from app.schemas.profile import ProfileResponse, ProfileListResponse
 from app.services.ingestion.factory import get_provider
+from app.services.ingestion.storage import store_profiles
 from app.services.filters.profile_filter import ProfileFilter
-from app.models import TrackingMetadata, Education, WorkHistory
-from datetime import datetime
+from app.api.pagination import decode_cursor, keyset_filter, next_cursor, timestamp_key
+from app.services.config_cache import get_tracking_config, touch_last_run
+from app.services.count_cache import cached_count, invalidate_counts
 
 
 router = APIRouter()
 
+# Columns needed to build a ProfileResponse
+_PROFILE_RESPONSE_COLUMNS = (
+    Profile.id,
+    Profile.external_id,
+    Profile.full_name,
+    Profile.current_title,
+    Profile.current_company,
+    Profile.location_state,
+    Profile.created_at,
+    Profile.updated_at,
+)
+
 
 @router.get("/profiles", response_model=ProfileListResponse)
-async def list_profiles(
-    page: int = Query(1, ge=1),
+def list_profiles(
+    page: int = Query(1, ge=1, description="Page number; ignored when cursor is given"),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(True, description="Include total row count"),
     db: Session = Depends(get_db),
     username: str = Depends(verify_credentials),
 ):
     """
     List tracked profiles with pagination.
     
+    When a cursor is given, keyset pagination on (updated_at, id) is used;
+    the cursor takes precedence over `page`, which is returned as null.
+    Otherwise falls back to offset pagination.
+    
     Args:
         page: Page number (1-indexed)
         page_size: Number of items per page
+        cursor: Opaque keyset cursor (optional, takes precedence over page)
+        include_total: Whether to return the (briefly cached) total count
         db: Database session
         username: Authenticated username
         
     Returns:
         Paginated list of profiles
     """
-    offset = (page - 1) * page_size
-    
-    # Get total count
-    total = db.query(Profile).count()
-    
-    # Get paginated profiles
-    profiles = (
-        db.query(Profile)
-        .order_by(Profile.updated_at.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
-    
+    # Get total count (memoized, skipped entirely when not requested)
+    total = cached_count(db.query(Profile), "profiles") if include_total else None
+    
+    # Same sort key for ordering and cursor comparison, so pages line up
+    updated_at = timestamp_key(db, Profile.updated_at)
+    ordering = (updated_at.desc(), Profile.id.desc())
+    
+    if cursor:
+        cursor_ts, cursor_id = decode_cursor(cursor)
+        cursor_key = timestamp_key(db, Profile.updated_at, cursor_ts)
+        profiles = (
+            db.query(*_PROFILE_RESPONSE_COLUMNS)
+            .filter(keyset_filter(updated_at, Profile.id, cursor_key, cursor_id))
+            .order_by(*ordering)
+            .limit(page_size)
+            .all()
+        )
+    else:
+        # Deferred join: page over the (updated_at, id) index first, then
+        # fetch full rows only for the ids on this page
+        page_ids = (
+            db.query(Profile.id)
+            .order_by(*ordering)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        profiles = (
+            db.query(*_PROFILE_RESPONSE_COLUMNS)
+            .filter(Profile.id.in_([row[0] for row in page_ids]))
+            .order_by(*ordering)
+            .all()
+        ) if page_ids else []
+    
+    # Rows come straight from typed columns, so skip re-validation
     return ProfileListResponse(
-        profiles=[ProfileResponse.model_validate(p) for p in profiles],
+        profiles=[ProfileResponse.model_construct(**row._mapping) for row in profiles],
         total=total,
-        page=page,
+        page=None if cursor else page,
         page_size=page_size,
+        next_cursor=next_cursor(profiles, page_size, "updated_at"),
     )
 
 
@@ -74,15 +119,15 @@ async def trigger_ingestion(
         Success message with count of ingested profiles
     """
     # Get tracking configuration
-    config = db.query(TrackingMetadata).first()
+    config = await run_in_threadpool(get_tracking_config, db)
     if not config:
         raise HTTPException(
             status_code=400,
             detail="Tracking configuration not set. Please configure companies and states first."
         )
     
-    target_companies = config.target_companies or []
-    target_states = config.target_states or []
+    target_companies = config.target_companies
+    target_states = config.target_states
     
     if not target_companies or not target_states:
         raise HTTPException(
@@ -105,29 +150,27 @@ async def trigger_ingestion(
     )
     
     # Fetch and filter profiles
+    results = await provider.search_by_companies(
+        target_companies,
+        filters={"state": target_states[0] if target_states else None}
+    )
     all_profiles = []
-    for company in target_companies:
-        try:
-            profiles = await provider.search_by_company(
-                company,
-                filters={"state": target_states[0] if target_states else None}
-            )
-            all_profiles.extend(profiles)
-        except Exception as e:
+    for company, result in zip(target_companies, results):
+        if isinstance(result, Exception):
             raise HTTPException(
                 status_code=500,
-                detail=f"Error fetching profiles for {company}: {str(e)}"
+                detail=f"Error fetching profiles for {company}: {str(result)}"
             )
+        all_profiles.extend(result)
     
     filtered_profiles = profile_filter.filter(all_profiles)
     
     # Store profiles
-    for profile_data in filtered_profiles:
-        _store_profile(db, profile_data)
+    await run_in_threadpool(store_profiles, db, filtered_profiles)
     
     # Update last ingestion timestamp
-    config.last_ingestion = datetime.now()
-    db.commit()
+    await run_in_threadpool(touch_last_run, db, "last_ingestion")
+    invalidate_counts()
     
     return {
         "message": "Ingestion completed",
@@ -136,62 +179,3 @@ async def trigger_ingestion(
         "stored": len(filtered_profiles),
     }
 
-
-def _store_profile(db: Session, profile_data):
-    """Store or update a profile in the database."""
-    # Check if profile exists
-    profile = db.query(Profile).filter(
-        Profile.external_id == profile_data.external_id
-    ).first()
-    
-    if not profile:
-        # Create new profile
-        profile = Profile(
-            external_id=profile_data.external_id,
-            full_name=profile_data.full_name,
-            current_title=profile_data.current_title,
-            current_company=profile_data.current_company,
-            location_state=profile_data.location_state,
-        )
-        db.add(profile)
-        db.flush()
-    else:
-        # Update existing profile
-        profile.full_name = profile_data.full_name
-        profile.current_title = profile_data.current_title
-        profile.current_company = profile_data.current_company
-        profile.location_state = profile_data.location_state
-    
-    # Store education
-    for edu_data in profile_data.education:
-        existing_edu = db.query(Education).filter(
-            Education.profile_id == profile.id,
-            Education.institution == edu_data.institution,
-            Education.graduation_year == edu_data.graduation_year
-        ).first()
-        
-        if not existing_edu:
-            edu = Education(
-                profile_id=profile.id,
-                institution=edu_data.institution,
-                graduation_year=edu_data.graduation_year,
-                degree_type=edu_data.degree_type,
-            )
-            db.add(edu)
-    
-    # Store work history snapshot
-    snapshot_date = datetime.now()
-    for work_data in profile_data.work_history:
-        work = WorkHistory(
-            profile_id=profile.id,
-            title=work_data.title,
-            company=work_data.company,
-            start_date=work_data.start_date,
-            end_date=work_data.end_date,
-            is_current=work_data.is_current,
-            snapshot_date=snapshot_date,
-        )
-        db.add(work)
-    
-    db.commit()
-
@@ -1,55 +1,71 @@
 """Founder transition API endpoints."""
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from typing import Optional
+from datetime import date
 from app.database import get_db
 from app.auth import verify_credentials
 from app.models import FounderEvent
 from app.schemas.transition import FounderEventResponse, FounderEventListResponse
+from app.api.pagination import decode_cursor, keyset_filter, next_cursor
+from app.services.count_cache import cached_count
 
 
 router = APIRouter()
 
 
 @router.get("/transitions", response_model=FounderEventListResponse)
-async def list_transitions(
-    page: int = Query(1, ge=1),
+def list_transitions(
+    page: int = Query(1, ge=1, description="Page number; ignored when cursor is given"),
     page_size: int = Query(50, ge=1, le=100),
     notified: bool = Query(None, description="Filter by notification status"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    include_total: bool = Query(True, description="Include total row count"),
     db: Session = Depends(get_db),
     username: str = Depends(verify_credentials),
 ):
     """
     List founder transition events with pagination.
     
+    When a cursor is given, keyset pagination on (detected_at, id) is used;
+    the cursor takes precedence over `page`, which is returned as null.
+    Otherwise falls back to offset pagination.
+    
     Args:
         page: Page number (1-indexed)
         page_size: Number of items per page
         notified: Filter by notification status (optional)
+        cursor: Opaque keyset cursor (optional, takes precedence over page)
+        include_total: Whether to return the (briefly cached) total count
         db: Database session
         username: Authenticated username
         
     Returns:
         Paginated list of founder events
     """
-    offset = (page - 1) * page_size
-    
     # Build query
     query = db.query(FounderEvent)
     
     if notified is not None:
         query = query.filter(FounderEvent.notified == notified)
     
-    # Get total count
-    total = query.count()
+    # Get total count (memoized, skipped entirely when not requested)
+    total = cached_count(query, f"founder_events:notified={notified}") if include_total else None
+    
+    # Eager-load profiles to avoid one SELECT per event
+    query = query.options(joinedload(FounderEvent.profile))
+    query = query.order_by(FounderEvent.detected_at.desc(), FounderEvent.id.desc())
+    
+    if cursor:
+        cursor_date, cursor_id = decode_cursor(cursor, date, int)
+        query = query.filter(
+            keyset_filter(FounderEvent.detected_at, FounderEvent.id, cursor_date, cursor_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
     
     # Get paginated events
-    events = (
-        query
-        .order_by(FounderEvent.detected_at.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
+    events = query.limit(page_size).all()
     
     # Convert to response format
     event_responses = []
@@ -70,7 +86,8 @@ async def list_transitions(
     return FounderEventListResponse(
         events=event_responses,
         total=total,
-        page=page,
+        page=None if cursor else page,
         page_size=page_size,
+        next_cursor=next_cursor(events, page_size, "detected_at"),
     )
 
@@ -1,11 +1,16 @@
 """Basic authentication middleware for FastAPI."""
+import hmac
 from fastapi import HTTPException, Security
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
-from app.config import settings
+from app.config import AUTH_USERNAME, AUTH_PASSWORD
 
 
 security = HTTPBasic()
 
+# Expected credentials, encoded once for constant-time comparison
+_EXPECTED_USERNAME = AUTH_USERNAME.encode()
+_EXPECTED_PASSWORD = AUTH_PASSWORD.encode()
+
 
 def verify_credentials(credentials: HTTPBasicCredentials = Security(security)) -> str:
     """
@@ -20,10 +25,10 @@ def verify_credentials(credentials: HTTPBasicCredentials = Security(security)) -
     Raises:
         HTTPException: If credentials are invalid
     """
-    if (
-        credentials.username != settings.BASIC_AUTH_USERNAME
-        or credentials.password != settings.BASIC_AUTH_PASSWORD
-    ):
+    # Compare both fields without short-circuiting to avoid leaking timing info
+    username_ok = hmac.compare_digest(credentials.username.encode(), _EXPECTED_USERNAME)
+    password_ok = hmac.compare_digest(credentials.password.encode(), _EXPECTED_PASSWORD)
+    if not (username_ok & password_ok):
         raise HTTPException(
             status_code=401,
             detail="Invalid authentication credentials",
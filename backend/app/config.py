@@ -2,6 +2,7 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
 from pathlib import Path
+import tempfile
 
 
 # Get the directory where this config file is located
@@ -13,6 +14,11 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./founder_tracker.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a connection is replaced
+    AUTO_CREATE_TABLES: bool = True  # Disable in production; use Alembic or app.scripts.init_db
     
     # API Keys
     APOLLO_API_KEY: Optional[str] = None
@@ -36,6 +42,8 @@ class Settings(BaseSettings):
     ENABLE_SCHEDULER: bool = True
     INGESTION_CRON: str = "0 2 * * *"  # Daily at 2 AM
     DETECTION_CRON: str = "0 3 * * *"  # Daily at 3 AM
+    # Lock file held by the one worker process that runs the scheduler
+    SCHEDULER_LOCK_FILE: str = str(Path(tempfile.gettempdir()) / "founder_tracker_scheduler.lock")
     
     class Config:
         env_file = str(BASE_DIR / ".env")
@@ -45,7 +53,7 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-# Debug: Print loaded settings on startup (remove in production)
-print(f"[Config] Loaded .env from: {BASE_DIR / '.env'}")
-print(f"[Config] APOLLO_API_KEY set: {bool(settings.APOLLO_API_KEY)}")
-
+# Frequently read settings bound to plain module constants for hot paths
+AUTH_USERNAME = settings.BASIC_AUTH_USERNAME
+AUTH_PASSWORD = settings.BASIC_AUTH_PASSWORD
+SCHEDULER_ENABLED = settings.ENABLE_SCHEDULER
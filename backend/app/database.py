@@ -5,11 +5,23 @@ from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
 
+_is_sqlite = "sqlite" in settings.DATABASE_URL
+
+# Pool sizing only applies to server databases; SQLite picks its own pool class
+_pool_options = {} if _is_sqlite else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    pool_pre_ping=True,  # Replace connections dropped while the scheduler was idle
     echo=False,  # Set to True for SQL query logging
+    **_pool_options,
 )
 
 # Create session factory
@@ -1,27 +1,70 @@
 """APScheduler configuration and job definitions."""
+import asyncio
+import os
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
 from sqlalchemy.orm import Session
-from app.config import settings
+from app.config import settings, SCHEDULER_ENABLED
 from app.database import SessionLocal
 from app.services.ingestion.factory import get_provider
+from app.services.ingestion.storage import store_profiles
 from app.services.filters.profile_filter import ProfileFilter
 from app.services.detection.founder_detector import FounderDetector
 from app.services.notifications.factory import get_notifier
-from app.models import Profile, Education, WorkHistory, TrackingMetadata
-from app.schemas.profile import ProfileData
+from app.services.config_cache import get_tracking_config, touch_last_run
+from app.services.count_cache import invalidate_counts
 
 
 scheduler = AsyncIOScheduler()
 
+# Open handle on the scheduler lock file, kept for the life of the process
+_lock_fd = None
+
+
+def _acquire_scheduler_lock() -> bool:
+    """
+    Try to become the single process that runs the scheduler.
+    
+    Takes a non-blocking exclusive flock on SCHEDULER_LOCK_FILE. All worker
+    processes (uvicorn --workers, gunicorn) race for it and only the first
+    one wins; the lock is released by the OS when that process exits.
+    
+    Returns:
+        True if this process holds the lock
+    """
+    global _lock_fd
+    if _lock_fd is not None:
+        return True
+    
+    try:
+        import fcntl
+    except ImportError:
+        # No flock (Windows): assume a single-process development server
+        return True
+    
+    fd = os.open(settings.SCHEDULER_LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    
+    _lock_fd = fd
+    return True
+
 
 def start_scheduler():
     """Start the scheduler with configured cron jobs."""
-    if not settings.ENABLE_SCHEDULER:
+    if not SCHEDULER_ENABLED:
         print("Scheduler is disabled in settings")
         return
     
+    # With multiple workers, only the lock holder runs the cron jobs
+    if not _acquire_scheduler_lock():
+        print("Scheduler already running in another worker process")
+        return
+    
     # Schedule daily ingestion job
     scheduler.add_job(
         run_ingestion_job,
@@ -55,13 +98,13 @@ async def run_ingestion_job():
     db: Session = SessionLocal()
     try:
         # Get tracking configuration
-        config = db.query(TrackingMetadata).first()
+        config = await asyncio.to_thread(get_tracking_config, db)
         if not config:
             print("No tracking configuration found. Skipping ingestion.")
             return
         
-        target_companies = config.target_companies or []
-        target_states = config.target_states or []
+        target_companies = config.target_companies
+        target_states = config.target_states
         
         if not target_companies or not target_states:
             print("Target companies or states not configured. Skipping ingestion.")
@@ -75,30 +118,28 @@ async def run_ingestion_job():
         )
         
         # Fetch profiles for each company
+        print(f"Fetching profiles for companies: {', '.join(target_companies)}")
+        results = await provider.search_by_companies(
+            target_companies,
+            filters={"state": target_states[0] if target_states else None}
+        )
         all_profiles = []
-        for company in target_companies:
-            try:
-                print(f"Fetching profiles for company: {company}")
-                profiles = await provider.search_by_company(
-                    company,
-                    filters={"state": target_states[0] if target_states else None}
-                )
-                all_profiles.extend(profiles)
-            except Exception as e:
-                print(f"Error fetching profiles for {company}: {e}")
+        for company, result in zip(target_companies, results):
+            if isinstance(result, Exception):
+                print(f"Error fetching profiles for {company}: {result}")
                 continue
+            all_profiles.extend(result)
         
         # Filter profiles
         filtered_profiles = profile_filter.filter(all_profiles)
         print(f"Filtered {len(filtered_profiles)} profiles from {len(all_profiles)} total")
         
         # Store or update profiles
-        for profile_data in filtered_profiles:
-            _store_profile(db, profile_data)
+        await asyncio.to_thread(store_profiles, db, filtered_profiles)
         
         # Update last ingestion timestamp
-        config.last_ingestion = datetime.now()
-        db.commit()
+        await asyncio.to_thread(touch_last_run, db, "last_ingestion")
+        invalidate_counts()
         
         print(f"[{datetime.now()}] Ingestion job completed. Processed {len(filtered_profiles)} profiles.")
     
@@ -121,7 +162,7 @@ async def run_detection_job():
     try:
         # Run detection
         detector = FounderDetector(db)
-        new_events = detector.detect_transitions()
+        new_events = await asyncio.to_thread(detector.detect_transitions)
         
         print(f"Detected {len(new_events)} new founder transitions")
         
@@ -131,19 +172,15 @@ async def run_detection_job():
             success = await notifier.send_founder_digest(new_events)
             
             if success:
-                # Mark events as notified
-                for event in new_events:
-                    event.notified = True
-                db.commit()
+                await asyncio.to_thread(detector.mark_notified, [event.id for event in new_events])
                 print(f"Notifications sent for {len(new_events)} events")
             else:
                 print("Failed to send notifications")
         
+        invalidate_counts()
+        
         # Update last detection timestamp
-        config = db.query(TrackingMetadata).first()
-        if config:
-            config.last_detection = datetime.now()
-            db.commit()
+        await asyncio.to_thread(touch_last_run, db, "last_detection")
         
         print(f"[{datetime.now()}] Detection job completed.")
     
@@ -153,71 +190,3 @@ async def run_detection_job():
     finally:
         db.close()
 
-
-def _store_profile(db: Session, profile_data: ProfileData):
-    """
-    Store or update a profile in the database.
-    
-    Args:
-        db: Database session
-        profile_data: Profile data to store
-    """
-    # Check if profile exists
-    profile = db.query(Profile).filter(
-        Profile.external_id == profile_data.external_id
-    ).first()
-    
-    if not profile:
-        # Create new profile
-        profile = Profile(
-            external_id=profile_data.external_id,
-            full_name=profile_data.full_name,
-            current_title=profile_data.current_title,
-            current_company=profile_data.current_company,
-            location_state=profile_data.location_state,
-        )
-        db.add(profile)
-        db.flush()  # Get profile ID
-    
-    else:
-        # Update existing profile
-        profile.full_name = profile_data.full_name
-        profile.current_title = profile_data.current_title
-        profile.current_company = profile_data.current_company
-        profile.location_state = profile_data.location_state
-    
-    # Store education
-    for edu_data in profile_data.education:
-        # Check if education already exists
-        existing_edu = db.query(Education).filter(
-            Education.profile_id == profile.id,
-            Education.institution == edu_data.institution,
-            Education.graduation_year == edu_data.graduation_year
-        ).first()
-        
-        if not existing_edu:
-            edu = Education(
-                profile_id=profile.id,
-                institution=edu_data.institution,
-                graduation_year=edu_data.graduation_year,
-                degree_type=edu_data.degree_type,
-            )
-            db.add(edu)
-    
-    # Store work history snapshot
-    snapshot_date = datetime.now()
-    for work_data in profile_data.work_history:
-        # Create snapshot entry
-        work = WorkHistory(
-            profile_id=profile.id,
-            title=work_data.title,
-            company=work_data.company,
-            start_date=work_data.start_date,
-            end_date=work_data.end_date,
-            is_current=work_data.is_current,
-            snapshot_date=snapshot_date,
-        )
-        db.add(work)
-    
-    db.commit()
-
@@ -5,10 +5,13 @@ from app.config import settings
 from app.database import engine, Base
 from app.api import profiles, config, transitions, jobs
 from app.jobs.scheduler import start_scheduler
+from app.services.ingestion.factory import close_providers
+from app.services.notifications.factory import close_notifiers
 
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+# Create database tables (development convenience; production runs migrations)
+if settings.AUTO_CREATE_TABLES:
+    Base.metadata.create_all(bind=engine)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -42,12 +45,13 @@ async def health_check():
 @app.on_event("startup")
 async def startup_event():
     """Startup event handler - initialize scheduler."""
-    if settings.ENABLE_SCHEDULER:
-        start_scheduler()
+    # start_scheduler checks ENABLE_SCHEDULER and lets only one worker run jobs
+    start_scheduler()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Shutdown event handler."""
-    pass
+    """Shutdown event handler - close provider and notifier HTTP clients."""
+    await close_providers()
+    await close_notifiers()
 
@@ -1,9 +1,20 @@
 """Education model for storing educational background."""
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, func, literal_column
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
+def graduation_year_key(column):
+    """
+    Unique-index expression for graduation_year.
+    
+    NULLs are distinct in unique indexes, so an unknown year is mapped to -1
+    to make rows without a year deduplicate too. The literal is inlined so
+    PostgreSQL can match ON CONFLICT targets against the index expression.
+    """
+    return func.coalesce(column, literal_column("-1"))
+
+
 class Education(Base):
     """Education record model."""
     
@@ -20,6 +31,15 @@ class Education(Base):
     # Relationship
     profile = relationship("Profile", back_populates="education")
     
+    # One row per (profile, institution, year); target of ingestion's ON CONFLICT
+    __table_args__ = (
+        Index(
+            "uq_education_profile_institution_year",
+            profile_id, institution, graduation_year_key(graduation_year),
+            unique=True,
+        ),
+    )
+    
     def __repr__(self):
         return f"<Education(id={self.id}, institution={self.institution}, year={self.graduation_year})>"
 
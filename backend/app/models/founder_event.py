@@ -1,5 +1,5 @@
 """Founder event model for tracking founder transitions."""
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Index, false
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -11,7 +11,7 @@ class FounderEvent(Base):
     __tablename__ = "founder_events"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    profile_id = Column(String, ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False, index=True)
+    profile_id = Column(String, ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False)
     
     # Transition details
     old_title = Column(String, nullable=True)  # Previous role
@@ -19,12 +19,26 @@ class FounderEvent(Base):
     new_company = Column(String, nullable=True)  # Company name if available
     
     # Detection metadata
-    detected_at = Column(Date, server_default=func.current_date(), nullable=False, index=True)
+    detected_at = Column(Date, server_default=func.current_date(), nullable=False)
     notified = Column(Boolean, default=False, nullable=False, index=True)  # Whether notification was sent
     
     # Relationship
     profile = relationship("Profile", back_populates="founder_events")
     
+    __table_args__ = (
+        # Composite index backing keyset pagination on (detected_at, id)
+        Index("ix_founder_events_detected_at_id", detected_at.desc(), id.desc()),
+        # Lookup of already detected (profile, title) transitions
+        Index("ix_founder_event_profile_title", profile_id, new_title),
+        # Partial index over the (small) set of events awaiting notification
+        Index(
+            "ix_founder_events_unnotified",
+            detected_at.desc(), id.desc(),
+            postgresql_where=notified == false(),
+            sqlite_where=notified == false(),
+        ),
+    )
+    
     def __repr__(self):
         return f"<FounderEvent(id={self.id}, profile={self.profile_id}, detected={self.detected_at})>"
 
@@ -1,5 +1,5 @@
 """Profile model for storing professional profile data."""
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, String, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -29,9 +29,20 @@ class Profile(Base):
     
     # Relationships
     education = relationship("Education", back_populates="profile", cascade="all, delete-orphan")
-    work_history = relationship("WorkHistory", back_populates="profile", cascade="all, delete-orphan")
+    # Newest snapshot first, so work_history[0] / [1] are the current / previous roles
+    work_history = relationship(
+        "WorkHistory",
+        back_populates="profile",
+        cascade="all, delete-orphan",
+        order_by="(WorkHistory.snapshot_date.desc(), WorkHistory.id)",
+    )
     founder_events = relationship("FounderEvent", back_populates="profile", cascade="all, delete-orphan")
     
+    # Composite index backing keyset pagination on (updated_at, id)
+    __table_args__ = (
+        Index("ix_profiles_updated_at_id", updated_at.desc(), id.desc()),
+    )
+    
     def __repr__(self):
         return f"<Profile(id={self.id}, name={self.full_name}, external_id={self.external_id})>"
 
@@ -1,31 +1,65 @@
 """Work history model for storing employment snapshots."""
-from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from typing import Optional
+from sqlalchemy import Column, Integer, String, Date, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.database import Base
 
 
+# Punctuation replaced by spaces in normalized titles
+_TITLE_TRANS = str.maketrans({"-": " ", "/": " "})
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    Normalize job title for comparison.
+    
+    Args:
+        title: Job title string
+        
+    Returns:
+        Lowercase, normalized title
+    """
+    if not title:
+        return ""
+    
+    # Lowercase, replace common punctuation in one pass, trim whitespace
+    return title.lower().translate(_TITLE_TRANS).strip()
+
+
 class WorkHistory(Base):
     """Work history snapshot model - stores historical employment data."""
     
     __tablename__ = "work_history"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    profile_id = Column(String, ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False, index=True)
+    profile_id = Column(String, ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False)
     
     # Employment details
     title = Column(String, nullable=False)
+    title_normalized = Column(String, nullable=True)  # normalize_title(title), stored at insert
     company = Column(String, nullable=True)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
     is_current = Column(Boolean, default=False, nullable=False)
     
     # Snapshot metadata - when this record was captured
-    snapshot_date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    snapshot_date = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationship
     profile = relationship("Profile", back_populates="work_history")
     
+    # Serves "latest snapshots per profile" lookups by index range scan
+    __table_args__ = (
+        Index("ix_work_history_profile_snapshot", profile_id, snapshot_date.desc()),
+    )
+    
+    @validates("title")
+    def _sync_title_normalized(self, key, title):
+        """Keep title_normalized in step with title for ORM writes."""
+        self.title_normalized = normalize_title(title)
+        return title
+    
     def __repr__(self):
         return f"<WorkHistory(id={self.id}, title={self.title}, company={self.company}, snapshot={self.snapshot_date})>"
 
@@ -32,6 +32,22 @@ class ProfileData(BaseModel):
     location_state: Optional[str] = Field(None, max_length=2, description="US state code (CA, NY, etc.)")
     education: List[EducationData] = Field(default_factory=list)
     work_history: List[WorkHistoryData] = Field(default_factory=list)
+    
+    # Normalized values used for filtering. Derived on access (not stored)
+    # so they stay correct for model_construct and model_copy(update=...)
+    @property
+    def current_company_norm(self) -> Optional[str]:
+        """Lowercased, stripped current_company (None if empty)."""
+        if not self.current_company:
+            return None
+        return self.current_company.lower().strip() or None
+    
+    @property
+    def location_state_norm(self) -> Optional[str]:
+        """Uppercased, stripped location_state (None if empty)."""
+        if not self.location_state:
+            return None
+        return self.location_state.upper().strip() or None
 
 
 class ProfileResponse(BaseModel):
@@ -52,7 +68,8 @@ class ProfileResponse(BaseModel):
 class ProfileListResponse(BaseModel):
     """Paginated profile list response."""
     profiles: List[ProfileResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None  # None for cursor-paginated responses
     page_size: int
+    next_cursor: Optional[str] = None
 
@@ -23,7 +23,8 @@ class FounderEventResponse(BaseModel):
 class FounderEventListResponse(BaseModel):
     """Paginated founder event list response."""
     events: List[FounderEventResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None  # None for cursor-paginated responses
     page_size: int
+    next_cursor: Optional[str] = None
 
@@ -0,0 +1 @@
+"""One-off management scripts."""
@@ -0,0 +1,17 @@
+"""Create database tables.
+
+Usage:
+    python -m app.scripts.init_db
+"""
+from app.database import engine, Base
+import app.models  # noqa: F401 - registers models on Base.metadata
+
+
+def init_db():
+    """Create all tables that do not exist yet."""
+    Base.metadata.create_all(bind=engine)
+
+
+if __name__ == "__main__":
+    init_db()
+    print("Database tables created")
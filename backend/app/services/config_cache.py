@@ -0,0 +1,69 @@
+"""In-memory cache of the singleton tracking configuration row."""
+import time
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.models import TrackingMetadata
+from app.schemas.config import ConfigResponse
+
+
+# Cached snapshot of the tracking_metadata row; loaded_at is None when stale
+_cache = {"value": None, "loaded_at": None}
+
+
+def get_tracking_config(db: Session, ttl: float = 30.0) -> Optional[ConfigResponse]:
+    """
+    Get the tracking configuration, served from memory for up to `ttl` seconds.
+
+    A detached snapshot is cached rather than the ORM row, so callers must
+    not rely on mutating it; use touch_last_run() to record job runs.
+
+    Args:
+        db: Database session used on a cache miss
+        ttl: Seconds a cached snapshot stays valid
+
+    Returns:
+        Configuration snapshot, or None if no configuration is stored
+    """
+    now = time.monotonic()
+    loaded_at = _cache["loaded_at"]
+    if loaded_at is not None and now - loaded_at < ttl:
+        return _cache["value"]
+
+    config = db.query(TrackingMetadata).first()
+    value = None
+    if config:
+        value = ConfigResponse(
+            target_companies=config.target_companies or [],
+            target_states=config.target_states or [],
+            last_ingestion=config.last_ingestion,
+            last_detection=config.last_detection,
+        )
+
+    _cache["value"] = value
+    _cache["loaded_at"] = now
+    return value
+
+
+def touch_last_run(db: Session, column: str) -> None:
+    """
+    Set a last-run timestamp ("last_ingestion" or "last_detection") to now.
+
+    Issues a single UPDATE without loading the row, commits, and
+    invalidates the cache.
+
+    Args:
+        db: Database session
+        column: Name of the timestamp column to update
+    """
+    db.query(TrackingMetadata).update(
+        {getattr(TrackingMetadata, column): datetime.now()},
+        synchronize_session=False,
+    )
+    db.commit()
+    invalidate_tracking_config()
+
+
+def invalidate_tracking_config() -> None:
+    """Drop the cached configuration; call after writing tracking_metadata."""
+    _cache["loaded_at"] = None
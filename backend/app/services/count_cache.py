@@ -0,0 +1,47 @@
+"""In-memory cache of list endpoint row counts."""
+import time
+from typing import Dict, Tuple
+
+
+# Memoized row counts: key -> (computed_at, count)
+_count_cache: Dict[str, Tuple[float, int]] = {}
+COUNT_CACHE_TTL = 30.0
+
+# Bumped by invalidate_counts(); counts computed under an older generation
+# are discarded instead of cached
+_generation = 0
+
+
+def cached_count(query, key: str, ttl: float = COUNT_CACHE_TTL) -> int:
+    """
+    Return query.count(), memoized for `ttl` seconds under `key`.
+    
+    A count whose query started before an invalidate_counts() call is
+    returned to the caller but not cached, so a write that commits while
+    the count runs cannot leave a stale entry behind.
+    
+    Args:
+        query: SQLAlchemy query to count
+        key: Cache key identifying the table and filters
+        ttl: Seconds a cached count stays valid
+        
+    Returns:
+        Row count (possibly up to `ttl` seconds stale)
+    """
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    
+    generation = _generation
+    total = query.count()
+    if generation == _generation:
+        _count_cache[key] = (now, total)
+    return total
+
+
+def invalidate_counts() -> None:
+    """Drop memoized counts; call after ingestion or detection commits."""
+    global _generation
+    _generation += 1
+    _count_cache.clear()
@@ -1,21 +1,24 @@
 """Founder detection engine."""
-from typing import List, Optional
-from datetime import datetime, date
-from sqlalchemy.orm import Session
-from app.models import Profile, WorkHistory, FounderEvent
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from datetime import date
+from sqlalchemy import Row, func, insert, or_, select
+from sqlalchemy.orm import Session, joinedload
+from app.models import WorkHistory, FounderEvent
+from app.models.work_history import normalize_title
 
 
-# Founder title keywords - case-insensitive matching
-FOUNDER_TITLES = {
-    "founder",
-    "co-founder",
-    "cofounder",
-    "ceo",
-    "chief executive officer",
-    "founding engineer",
-    "founding",
-    "owner",
-}
+# Founder title keywords as whole words, matched against normalized
+# (lowercased, "-" and "/" replaced by spaces) titles in a single scan
+_FOUNDER_RE = re.compile(
+    r"\b(?:founder|co[- ]?founder|ceo|chief executive officer|founding(?: engineer)?|owner)\b"
+)
+
+# Substrings covering every _FOUNDER_RE alternative, for the SQL pre-filter
+_FOUNDER_SQL_KEYWORDS = ("founder", "founding", "ceo", "chief executive officer", "owner")
+
+# Number of work history rows fetched per batch while scanning for transitions
+PROFILE_BATCH_SIZE = 500
 
 
 class FounderDetector:
@@ -41,60 +44,123 @@ class FounderDetector:
         Detect founder transitions for all tracked profiles.
         
         Compares current work history with previous snapshots to identify
-        transitions into founder roles.
+        transitions into founder roles. The two latest snapshots of every
+        profile and all previously detected transitions are each loaded
+        with a single query.
+        
+        The returned events are loaded after the commit together with their
+        profiles, so callers can read them (e.g. to build a digest) without
+        further queries.
         
         Returns:
             List of newly created FounderEvent records
         """
-        new_events = []
+        event_rows = []
         
-        # Get all tracked profiles
-        profiles = self.db.query(Profile).all()
+        # (profile_id, new_title) pairs that already have an event
+        seen = {
+            tuple(row)
+            for row in self.db.execute(select(FounderEvent.profile_id, FounderEvent.new_title))
+        }
         
-        for profile in profiles:
-            # Get current work history (most recent snapshot)
-            current_work = self._get_current_work(profile.id)
-            
-            if not current_work:
-                continue
-            
-            # Get previous work history (second most recent snapshot)
-            previous_work = self._get_previous_work(profile.id)
-            
+        for profile_id, current_work, previous_work in self._latest_work_pairs():
             # Check if this is a founder transition
             if self._is_founder_transition(previous_work, current_work):
                 # Check if we've already detected this transition
-                if not self._already_detected(profile.id, current_work.title):
-                    event = self._create_event(profile, previous_work, current_work)
-                    new_events.append(event)
-                    self.db.add(event)
+                key = (profile_id, current_work.title)
+                if key not in seen:
+                    event_rows.append(self._create_event(profile_id, previous_work, current_work))
+                    seen.add(key)
+        
+        # One multi-row INSERT; RETURNING hands back the new ids
+        new_ids = []
+        if event_rows:
+            new_ids = list(
+                self.db.scalars(insert(FounderEvent).returning(FounderEvent.id), event_rows)
+            )
         
         self.db.commit()
-        return new_events
-    
-    def _get_current_work(self, profile_id: str) -> Optional[WorkHistory]:
-        """Get most recent work history snapshot for a profile."""
+        
+        if not new_ids:
+            return []
+        
+        # Commit expires loaded objects; reload events and profiles in one query
         return (
-            self.db.query(WorkHistory)
-            .filter(WorkHistory.profile_id == profile_id)
-            .order_by(WorkHistory.snapshot_date.desc())
-            .first()
+            self.db.query(FounderEvent)
+            .options(joinedload(FounderEvent.profile))
+            .filter(FounderEvent.id.in_(new_ids))
+            .order_by(FounderEvent.id)
+            .all()
         )
     
-    def _get_previous_work(self, profile_id: str) -> Optional[WorkHistory]:
-        """Get second most recent work history snapshot for a profile."""
-        return (
-            self.db.query(WorkHistory)
-            .filter(WorkHistory.profile_id == profile_id)
-            .order_by(WorkHistory.snapshot_date.desc())
-            .offset(1)
-            .first()
+    def mark_notified(self, event_ids: List[int]) -> None:
+        """
+        Mark founder events as notified with a single UPDATE and commit.
+        
+        Args:
+            event_ids: IDs of the events included in a sent digest
+        """
+        self.db.query(FounderEvent).filter(
+            FounderEvent.id.in_(event_ids)
+        ).update({FounderEvent.notified: True}, synchronize_session=False)
+        self.db.commit()
+    
+    def _latest_work_pairs(self) -> Iterator[Tuple[str, Row, Optional[Row]]]:
+        """
+        Yield (profile_id, current_work, previous_work) for every profile.
+        
+        Ranks each profile's work history by snapshot date with ROW_NUMBER()
+        and streams the top two rows per profile in one query. Profiles whose
+        current title has no founder keyword are filtered out in SQL.
+        """
+        ranked = (
+            select(
+                WorkHistory.profile_id,
+                WorkHistory.title,
+                WorkHistory.title_normalized,
+                WorkHistory.company,
+                func.row_number().over(
+                    partition_by=WorkHistory.profile_id,
+                    order_by=(WorkHistory.snapshot_date.desc(), WorkHistory.id),
+                ).label("rn"),
+            )
+            .subquery()
         )
+        # Coarse keyword pre-filter on the current title; exact word-boundary
+        # matching still happens in _is_founder_transition
+        candidates = select(ranked.c.profile_id).where(
+            ranked.c.rn == 1,
+            or_(
+                # Not yet normalized; checked via the normalize_title fallback
+                ranked.c.title_normalized.is_(None),
+                *(
+                    ranked.c.title_normalized.like(f"%{keyword}%")
+                    for keyword in _FOUNDER_SQL_KEYWORDS
+                ),
+            ),
+        )
+        rows = (
+            self.db.query(ranked)
+            .filter(ranked.c.rn <= 2, ranked.c.profile_id.in_(candidates))
+            .order_by(ranked.c.profile_id, ranked.c.rn)
+            .yield_per(PROFILE_BATCH_SIZE)
+        )
+        
+        current_id, current_work, previous_work = None, None, None
+        for row in rows:
+            if row.profile_id != current_id:
+                if current_id is not None:
+                    yield current_id, current_work, previous_work
+                current_id, current_work, previous_work = row.profile_id, row, None
+            else:
+                previous_work = row
+        if current_id is not None:
+            yield current_id, current_work, previous_work
     
     def _is_founder_transition(
         self,
-        previous_work: Optional[WorkHistory],
-        current_work: WorkHistory
+        previous_work: Optional[Row],
+        current_work: Row
     ) -> bool:
         """
         Check if current work represents a founder transition.
@@ -106,14 +172,8 @@ class FounderDetector:
         Returns:
             True if this is a founder transition
         """
-        current_title_normalized = self._normalize_title(current_work.title)
-        is_current_founder = any(
-            keyword in current_title_normalized
-            for keyword in FOUNDER_TITLES
-        )
-        
         # If current role is not a founder role, no transition
-        if not is_current_founder:
+        if _FOUNDER_RE.search(self._normalized(current_work)) is None:
             return False
         
         # If no previous work, this might be a founder transition
@@ -121,81 +181,43 @@ class FounderDetector:
         if previous_work is None:
             return True
         
-        # Check if previous role was also a founder role
-        previous_title_normalized = self._normalize_title(previous_work.title)
-        was_previous_founder = any(
-            keyword in previous_title_normalized
-            for keyword in FOUNDER_TITLES
-        )
-        
-        # Transition detected if previous was NOT founder and current IS founder
-        return not was_previous_founder and is_current_founder
+        # Transition detected if previous was NOT a founder role
+        return _FOUNDER_RE.search(self._normalized(previous_work)) is None
     
-    def _normalize_title(self, title: str) -> str:
+    def _normalized(self, work) -> str:
         """
-        Normalize job title for comparison.
+        Get the normalized title of a work history row.
         
-        Args:
-            title: Job title string
-            
-        Returns:
-            Lowercase, normalized title
+        Uses the stored title_normalized column, falling back to normalizing
+        on the fly for rows written before the column existed.
         """
-        if not title:
-            return ""
-        
-        # Convert to lowercase and remove extra whitespace
-        normalized = title.lower().strip()
-        
-        # Remove common punctuation
-        normalized = normalized.replace("-", " ").replace("/", " ")
-        
-        return normalized
-    
-    def _already_detected(self, profile_id: str, new_title: str) -> bool:
-        """
-        Check if this transition has already been detected.
-        
-        Args:
-            profile_id: Profile ID
-            new_title: New title to check
-            
-        Returns:
-            True if event already exists
-        """
-        existing = (
-            self.db.query(FounderEvent)
-            .filter(
-                FounderEvent.profile_id == profile_id,
-                FounderEvent.new_title == new_title
-            )
-            .first()
-        )
-        return existing is not None
+        if work.title_normalized is not None:
+            return work.title_normalized
+        return normalize_title(work.title)
     
     def _create_event(
         self,
-        profile: Profile,
+        profile_id: str,
         previous_work: Optional[WorkHistory],
         current_work: WorkHistory
-    ) -> FounderEvent:
+    ) -> Dict[str, Any]:
         """
-        Create a new founder event record.
+        Build the column values for a new founder event record.
         
         Args:
-            profile: Profile model
+            profile_id: Profile ID
             previous_work: Previous work history
             current_work: Current work history
             
         Returns:
-            New FounderEvent instance
+            Mapping of FounderEvent column values
         """
-        return FounderEvent(
-            profile_id=profile.id,
-            old_title=previous_work.title if previous_work else None,
-            new_title=current_work.title,
-            new_company=current_work.company,
-            detected_at=date.today(),
-            notified=False
-        )
+        return {
+            "profile_id": profile_id,
+            "old_title": previous_work.title if previous_work else None,
+            "new_title": current_work.title,
+            "new_company": current_work.company,
+            "detected_at": date.today(),
+            "notified": False,
+        }
 
@@ -1,4 +1,6 @@
 """Profile filtering logic."""
+import re
+import sys
 from typing import List, Set
 from datetime import datetime
 from app.schemas.profile import ProfileData
@@ -14,6 +16,13 @@ class ProfileFilter:
     - Experience: Must have >= 7 years experience (inferred from undergrad graduation)
     """
     
+    # Undergraduate degree names and abbreviations (BS, B.Sc., BA, BBA, BSBA,
+    # B.Eng, BE, BFA, B.Tech, ...); word boundaries keep "mba" or "abstract" out
+    _UNDERGRAD_RE = re.compile(
+        r"\b(?:bachelor|undergrad)"
+        r"|\bb\.?(?:s\.?c?|a|s\.?b\.?a|b\.?a|e\.?ng|e|f\.?a|tech|com|arch)\.?(?![a-z])"
+    )
+    
     def __init__(
         self,
         target_companies: List[str],
@@ -28,8 +37,9 @@ class ProfileFilter:
             target_states: List of US state codes (e.g., ["CA", "NY"])
             min_experience_years: Minimum years of experience (default: 7)
         """
-        self.target_companies = {c.lower().strip() for c in target_companies}
-        self.target_states = {s.upper().strip() for s in target_states}
+        # Immutable lookup tables of interned keys
+        self.target_companies = frozenset(sys.intern(c.lower().strip()) for c in target_companies)
+        self.target_states = frozenset(sys.intern(s.upper().strip()) for s in target_states)
         self.min_experience_years = min_experience_years
     
     def filter(self, profiles: List[ProfileData]) -> List[ProfileData]:
@@ -42,14 +52,15 @@ class ProfileFilter:
         Returns:
             Filtered list of profiles that meet all criteria
         """
-        filtered = []
-        for profile in profiles:
-            if self._matches_company(profile) and \
-               self._matches_location(profile) and \
-               self._matches_experience(profile):
-                filtered.append(profile)
-        
-        return filtered
+        current_year = datetime.now().year
+        
+        # Cheapest, most selective check first; work history scan last
+        return [
+            profile for profile in profiles
+            if self._matches_location(profile)
+            and self._matches_experience(profile, current_year)
+            and self._matches_company(profile)
+        ]
     
     def _matches_company(self, profile: ProfileData) -> bool:
         """
@@ -66,16 +77,17 @@ class ProfileFilter:
             True if matches company filter
         """
         # Check current company
-        if profile.current_company:
-            if profile.current_company.lower().strip() in self.target_companies:
-                return True
+        if profile.current_company_norm in self.target_companies:
+            return True
         
-        # Check work history
-        for work in profile.work_history:
-            if work.company and work.company.lower().strip() in self.target_companies:
-                return True
+        if not profile.work_history:
+            return False
         
-        return False
+        # Check work history
+        history_companies = {
+            work.company.lower().strip() for work in profile.work_history if work.company
+        }
+        return not history_companies.isdisjoint(self.target_companies)
     
     def _matches_location(self, profile: ProfileData) -> bool:
         """
@@ -87,12 +99,9 @@ class ProfileFilter:
         Returns:
             True if location state is in target states
         """
-        if not profile.location_state:
-            return False
-        
-        return profile.location_state.upper().strip() in self.target_states
+        return profile.location_state_norm in self.target_states
     
-    def _matches_experience(self, profile: ProfileData) -> bool:
+    def _matches_experience(self, profile: ProfileData, current_year: int) -> bool:
         """
         Check if profile matches experience filter.
         
@@ -101,6 +110,7 @@ class ProfileFilter:
         
         Args:
             profile: Profile to check
+            current_year: Year to measure experience against
             
         Returns:
             True if experience >= min_experience_years
@@ -111,7 +121,7 @@ class ProfileFilter:
         for edu in profile.education:
             # Look for undergraduate degrees
             degree_type = (edu.degree_type or "").lower()
-            if any(term in degree_type for term in ["bachelor", "undergrad", "bs", "ba"]):
+            if self._UNDERGRAD_RE.search(degree_type):
                 if edu.graduation_year:
                     graduation_year = edu.graduation_year
                     break
@@ -126,7 +136,6 @@ class ProfileFilter:
             return False  # Cannot determine experience without graduation year
         
         # Calculate experience
-        current_year = datetime.now().year
         experience_years = current_year - graduation_year
         
         return experience_years >= self.min_experience_years
@@ -1,6 +1,7 @@
 """Ingestion services package."""
 from app.services.ingestion.base import PeopleDataProvider
-from app.services.ingestion.factory import get_provider
+from app.services.ingestion.factory import get_provider, close_providers
+from app.services.ingestion.storage import store_profiles
 
-__all__ = ["PeopleDataProvider", "get_provider"]
+__all__ = ["PeopleDataProvider", "get_provider", "close_providers", "store_profiles"]
 
@@ -1,6 +1,7 @@
 """Apollo.io API implementation."""
+import asyncio
 import httpx
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
 from app.services.ingestion.base import PeopleDataProvider
 from app.schemas.profile import ProfileData, EducationData, WorkHistoryData
 from app.config import settings
@@ -15,6 +16,9 @@ class ApolloProvider(PeopleDataProvider):
     
     BASE_URL = "https://api.apollo.io/v1"
     
+    # Maximum concurrent requests during bulk refresh
+    MAX_CONCURRENT_REQUESTS = 10
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Apollo provider.
@@ -25,23 +29,50 @@ class ApolloProvider(PeopleDataProvider):
         self.api_key = api_key or settings.APOLLO_API_KEY
         if not self.api_key:
             raise ValueError("APOLLO_API_KEY must be set")
+        
+        # Shared HTTP client, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it lazily.
+        
+        Reusing one client keeps its connection pool (and TLS sessions)
+        alive across searches and profile lookups.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Api-Key": self.api_key,
+                },
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def search_by_company(
         self, 
         company: str, 
         filters: Optional[Dict] = None
-    ) -> List[ProfileData]:
+    ) -> AsyncIterator[ProfileData]:
         """
         Search for people by company using Apollo.io API.
         
-        Uses the /mixed_people/search endpoint with POST request.
+        Uses the /mixed_people/search endpoint with POST request. Profiles
+        are yielded page by page as responses arrive.
         
         Args:
             company: Company name to search
             filters: Additional filters (e.g., {'state': 'CA'})
             
-        Returns:
-            List of ProfileData objects
+        Yields:
+            ProfileData objects
         """
         filters = filters or {}
         
@@ -57,52 +88,44 @@ class ApolloProvider(PeopleDataProvider):
             # Apollo uses person_locations for state filtering
             body["person_locations"] = [f"United States, {filters['state']}"]
         
-        # Headers with API key (Apollo requires X-Api-Key header)
-        headers = {
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key,
-        }
+        client = self._get_client()
         
-        all_profiles = []
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Paginate through results (limit to first 3 pages for safety)
-            max_pages = 3
-            
-            while body["page"] <= max_pages:
-                try:
-                    # Use /people/search endpoint (available on free plans)
-                    response = await client.post(
-                        f"{self.BASE_URL}/people/search",
-                        json=body,
-                        headers=headers
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    people = data.get("people", [])
-                    if not people:
-                        break
-                    
-                    # Convert Apollo format to ProfileData
-                    for person in people:
-                        profile = self._convert_apollo_person(person)
-                        if profile:
-                            all_profiles.append(profile)
-                    
-                    # Check if there are more pages
-                    pagination = data.get("pagination", {})
-                    total_pages = pagination.get("total_pages", 1)
-                    
-                    if body["page"] >= total_pages:
-                        break
-                    
-                    body["page"] += 1
-                    
-                except httpx.HTTPStatusError as e:
-                    print(f"Apollo API error: {e.response.status_code} - {e.response.text}")
-                    raise
-        
-        return all_profiles
+        # Paginate through results (limit to first 3 pages for safety)
+        max_pages = 3
+        
+        while body["page"] <= max_pages:
+            try:
+                # Use /people/search endpoint (available on free plans)
+                response = await client.post(
+                    f"{self.BASE_URL}/people/search",
+                    json=body,
+                    timeout=60.0
+                )
+                response.raise_for_status()
+                data = response.json()
+                
+                people = data.get("people", [])
+                if not people:
+                    break
+                
+                # Convert Apollo format to ProfileData
+                for person in people:
+                    profile = self._convert_apollo_person(person)
+                    if profile:
+                        yield profile
+                
+                # Check if there are more pages
+                pagination = data.get("pagination", {})
+                total_pages = pagination.get("total_pages", 1)
+                
+                if body["page"] >= total_pages:
+                    break
+                
+                body["page"] += 1
+                
+            except httpx.HTTPStatusError as e:
+                print(f"Apollo API error: {e.response.status_code} - {e.response.text}")
+                raise
     
     async def get_profile(self, profile_id: str) -> ProfileData:
         """
@@ -114,46 +137,48 @@ class ApolloProvider(PeopleDataProvider):
         Returns:
             ProfileData object
         """
-        headers = {
-            "Content-Type": "application/json",
-            "X-Api-Key": self.api_key,
-        }
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self.BASE_URL}/people/{profile_id}",
-                headers=headers
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            person = data.get("person", {})
-            profile = self._convert_apollo_person(person)
-            if not profile:
-                raise ValueError(f"Invalid profile data for ID: {profile_id}")
-            
-            return profile
+        response = await self._get_client().get(f"{self.BASE_URL}/people/{profile_id}")
+        response.raise_for_status()
+        data = response.json()
+        
+        person = data.get("person", {})
+        profile = self._convert_apollo_person(person)
+        if not profile:
+            raise ValueError(f"Invalid profile data for ID: {profile_id}")
+        
+        return profile
     
     async def bulk_refresh(self, profile_ids: List[str]) -> List[ProfileData]:
         """
         Refresh multiple profiles in bulk.
         
+        Apollo has no bulk endpoint, so profiles are fetched concurrently
+        over the shared client, bounded by MAX_CONCURRENT_REQUESTS.
+        
         Args:
             profile_ids: List of Apollo person IDs
             
         Returns:
             List of updated ProfileData objects
         """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        async def refresh(profile_id: str) -> ProfileData:
+            async with semaphore:
+                return await self.get_profile(profile_id)
+        
+        results = await asyncio.gather(
+            *(refresh(profile_id) for profile_id in profile_ids),
+            return_exceptions=True
+        )
+        
         profiles = []
-        # Apollo doesn't have a true bulk endpoint, so we fetch individually
-        # In production, consider batching with asyncio.gather
-        for profile_id in profile_ids:
-            try:
-                profile = await self.get_profile(profile_id)
-                profiles.append(profile)
-            except Exception as e:
+        for profile_id, result in zip(profile_ids, results):
+            if isinstance(result, Exception):
                 # Log error but continue with other profiles
-                print(f"Error refreshing profile {profile_id}: {e}")
+                print(f"Error refreshing profile {profile_id}: {result}")
                 continue
+            profiles.append(result)
         
         return profiles
     
@@ -161,6 +186,9 @@ class ApolloProvider(PeopleDataProvider):
         """
         Convert Apollo.io person object to ProfileData.
         
+        Models are built with model_construct (no validation) since every
+        field is normalized to the right type here.
+        
         Args:
             person: Apollo person dictionary
             
@@ -175,22 +203,22 @@ class ApolloProvider(PeopleDataProvider):
         schools = person.get("schools", [])
         for school in schools:
             if school.get("name"):
-                education.append(EducationData(
-                    institution=school.get("name", ""),
-                    graduation_year=school.get("graduation_year"),
-                    degree_type=school.get("degree")
+                education.append(EducationData.model_construct(
+                    institution=school["name"],
+                    graduation_year=self._parse_year(school.get("graduation_year")),
+                    degree_type=school.get("degree") or None
                 ))
         
         # Extract work history
         work_history = []
         experiences = person.get("experience", [])
         for exp in experiences:
-            work_history.append(WorkHistoryData(
-                title=exp.get("title", ""),
+            work_history.append(WorkHistoryData.model_construct(
+                title=exp.get("title") or "",
                 company=exp.get("organization_name"),
                 start_date=self._parse_date(exp.get("started_at")),
                 end_date=self._parse_date(exp.get("ended_at")),
-                is_current=exp.get("is_current", False)
+                is_current=bool(exp.get("is_current"))
             ))
         
         # Extract location state
@@ -204,16 +232,26 @@ class ApolloProvider(PeopleDataProvider):
             elif len(location) == 2:
                 location_state = location.upper()
         
-        return ProfileData(
+        return ProfileData.model_construct(
             external_id=str(person.get("id", "")),
-            full_name=person.get("name", ""),
+            full_name=person.get("name") or "",
             current_title=person.get("title"),
             current_company=person.get("organization_name"),
             location_state=location_state,
             education=education,
-            work_history=work_history
+            work_history=work_history,
         )
     
+    @staticmethod
+    def _parse_year(value) -> Optional[int]:
+        """Coerce a graduation year (int or numeric string) to int."""
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    
     @staticmethod
     def _parse_date(date_str: Optional[str]):
         """Parse date string to date object."""
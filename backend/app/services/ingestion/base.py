@@ -1,6 +1,7 @@
 """Abstract base class for people data providers."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Union
 from app.schemas.profile import ProfileData
 
 
@@ -14,20 +15,23 @@ class PeopleDataProvider(ABC):
     """
     
     @abstractmethod
-    async def search_by_company(
+    def search_by_company(
         self, 
         company: str, 
         filters: dict = None
-    ) -> List[ProfileData]:
+    ) -> AsyncIterator[ProfileData]:
         """
         Search for profiles by company name.
         
+        Implemented as an async generator so consumers can start on the
+        first page of results while later pages are still being fetched.
+        
         Args:
             company: Company name to search for
             filters: Additional filters (e.g., location, state)
             
-        Returns:
-            List of ProfileData objects
+        Yields:
+            ProfileData objects
         """
         pass
     
@@ -57,3 +61,39 @@ class PeopleDataProvider(ABC):
         """
         pass
 
+    
+    async def aclose(self):
+        """Release network resources held by the provider (no-op by default)."""
+        pass
+    
+    async def search_by_companies(
+        self,
+        companies: List[str],
+        filters: dict = None,
+        max_concurrency: int = 5
+    ) -> List[Union[List[ProfileData], Exception]]:
+        """
+        Search several companies concurrently.
+        
+        Args:
+            companies: Company names to search for
+            filters: Additional filters applied to every search
+            max_concurrency: Maximum number of in-flight searches
+            
+        Returns:
+            One entry per company, in order: the profiles found, or the
+            exception raised by that company's search
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def search(company: str) -> List[ProfileData]:
+            async with semaphore:
+                return [
+                    profile
+                    async for profile in self.search_by_company(company, filters=filters)
+                ]
+        
+        return await asyncio.gather(
+            *(search(company) for company in companies),
+            return_exceptions=True
+        )
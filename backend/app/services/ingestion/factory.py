@@ -1,15 +1,20 @@
 """Factory for creating people data provider instances."""
-from typing import Optional
+from typing import Dict, Optional
 from app.services.ingestion.base import PeopleDataProvider
-from app.services.ingestion.apollo import ApolloProvider
-from app.services.ingestion.mock import MockProvider
 from app.config import settings
 
 
+# Provider instances by name, shared across requests and scheduled jobs
+_providers: Dict[str, PeopleDataProvider] = {}
+
+
 def get_provider(provider_name: Optional[str] = None) -> PeopleDataProvider:
     """
     Factory function to get the appropriate people data provider.
     
+    Instances are cached per provider name so API clients are built once
+    and reused across requests and scheduled jobs.
+    
     Args:
         provider_name: Name of provider (defaults to settings)
         
@@ -21,9 +26,24 @@ def get_provider(provider_name: Optional[str] = None) -> PeopleDataProvider:
     """
     provider_name = provider_name or settings.PEOPLE_DATA_PROVIDER
     
+    provider = _providers.get(provider_name)
+    if provider is None:
+        provider = _providers[provider_name] = _create_provider(provider_name)
+    return provider
+
+
+def _create_provider(provider_name: str) -> PeopleDataProvider:
+    """
+    Construct a new provider instance by name.
+    
+    Provider modules are imported lazily so only the configured provider's
+    dependencies (e.g. httpx for Apollo) are loaded.
+    """
     if provider_name == "apollo":
+        from app.services.ingestion.apollo import ApolloProvider
         return ApolloProvider()
     elif provider_name == "mock":
+        from app.services.ingestion.mock import MockProvider
         return MockProvider()
     # Future providers can be added here:
     # elif provider_name == "proxycurl":
@@ -33,3 +53,9 @@ def get_provider(provider_name: Optional[str] = None) -> PeopleDataProvider:
     else:
         raise ValueError(f"Unknown provider: {provider_name}. Valid options: apollo, mock")
 
+
+async def close_providers():
+    """Close all cached providers; call on application shutdown."""
+    for provider in _providers.values():
+        await provider.aclose()
+    _providers.clear()
@@ -1,5 +1,6 @@
 """Mock provider for testing without API access."""
-from typing import List, Optional, Dict
+import asyncio
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from app.services.ingestion.base import PeopleDataProvider
 from app.schemas.profile import ProfileData, EducationData, WorkHistoryData
 from datetime import date
@@ -14,95 +15,134 @@ class MockProvider(PeopleDataProvider):
     """
     
     # Sample data for generating mock profiles
-    FIRST_NAMES = ["John", "Jane", "Michael", "Sarah", "David", "Emily", "Chris", "Lisa", "Alex", "Rachel"]
-    LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Martinez", "Wilson"]
-    TITLES = ["Software Engineer", "Product Manager", "Data Scientist", "Engineering Manager", "VP Engineering", "Director of Product"]
-    FOUNDER_TITLES = ["Founder", "Co-Founder", "CEO", "Founding Engineer", "Owner"]
-    UNIVERSITIES = ["Stanford University", "MIT", "Harvard University", "UC Berkeley", "Carnegie Mellon", "Georgia Tech"]
+    FIRST_NAMES = ("John", "Jane", "Michael", "Sarah", "David", "Emily", "Chris", "Lisa", "Alex", "Rachel")
+    LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Martinez", "Wilson")
+    TITLES = ("Software Engineer", "Product Manager", "Data Scientist", "Engineering Manager", "VP Engineering", "Director of Product")
+    FOUNDER_TITLES = ("Founder", "Co-Founder", "CEO", "Founding Engineer", "Owner")
+    UNIVERSITIES = ("Stanford University", "MIT", "Harvard University", "UC Berkeley", "Carnegie Mellon", "Georgia Tech")
+    
+    # Profile returned by get_profile, built once and copied per call
+    _PROFILE_TEMPLATE = ProfileData(
+        external_id="__template__",
+        full_name="Mock Person",
+        current_title="Software Engineer",
+        current_company="Mock Company",
+        location_state="CA",
+        education=[
+            EducationData(
+                institution="Stanford University",
+                graduation_year=2015,
+                degree_type="Bachelor's"
+            )
+        ],
+        work_history=[]
+    )
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize mock provider.
+        
+        Args:
+            seed: Seed for this provider's random generator, for
+                reproducible output in tests (random if omitted)
+        """
+        self._rng = random.Random(seed)
     
     async def search_by_company(
         self, 
         company: str, 
         filters: Optional[Dict] = None
-    ) -> List[ProfileData]:
+    ) -> AsyncIterator[ProfileData]:
         """Generate mock profiles for a company search."""
+        for profile in self.generate_profiles(company, filters):
+            yield profile
+    
+    def generate_profiles(
+        self,
+        company: str,
+        filters: Optional[Dict] = None
+    ) -> List[ProfileData]:
+        """
+        Generate mock profiles for a company synchronously.
+        
+        Does all the work of search_by_company without coroutine overhead,
+        so sync callers (scripts, tests) can use it directly.
+        """
+        # Local aliases avoid global lookups in the construction loop
+        PD, ED, WH = ProfileData, EducationData, WorkHistoryData
+        
         filters = filters or {}
         state = filters.get("state", "CA")
+        effective_state = state if isinstance(state, str) else (state[0] if state else "CA")
+        
+        rng = self._rng
+        choices = rng.choices
         
         # Generate 5-10 mock profiles per company
-        num_profiles = random.randint(5, 10)
-        profiles = []
+        num_profiles = rng.randint(5, 10)
+        
+        # Draw every random field for the whole batch up front
+        n = num_profiles
+        first_names = choices(self.FIRST_NAMES, k=n)
+        last_names = choices(self.LAST_NAMES, k=n)
+        titles = choices(self.TITLES, k=n)
+        founder_titles = choices(self.FOUNDER_TITLES, k=n)
+        previous_titles = choices(self.TITLES, k=n)
+        universities = choices(self.UNIVERSITIES, k=n)
+        # Randomly decide if each person has become a founder (10% chance)
+        founder_flags = [x < 10 for x in choices(range(100), k=n)]
+        # Graduation years 7-15 years ago
+        graduation_years = choices(range(2024 - 15, 2024 - 7 + 1), k=n)
+        suffixes = choices(range(1000, 10000), k=n)
+        
+        slug = company.lower().replace(' ', '-')
         
-        for i in range(num_profiles):
-            # Randomly decide if this person has become a founder (10% chance)
-            is_founder = random.random() < 0.1
-            
-            first_name = random.choice(self.FIRST_NAMES)
-            last_name = random.choice(self.LAST_NAMES)
-            
-            # Current role
-            if is_founder:
-                current_title = random.choice(self.FOUNDER_TITLES)
-                current_company = f"{first_name}'s Startup Inc."
-            else:
-                current_title = random.choice(self.TITLES)
-                current_company = company
-            
-            # Generate graduation year (7-15 years ago)
-            graduation_year = 2024 - random.randint(7, 15)
-            
-            profiles.append(ProfileData(
-                external_id=f"mock-{company.lower().replace(' ', '-')}-{i}-{random.randint(1000, 9999)}",
+        # Identical (title, company, is_current) roles share one object; they
+        # are never mutated after generation
+        wh_cache: Dict[Tuple[str, str, bool], WorkHistoryData] = {}
+        
+        def _wh(title: str, work_company: str, is_current: bool) -> WorkHistoryData:
+            key = (title, work_company, is_current)
+            work = wh_cache.get(key)
+            if work is None:
+                work = wh_cache[key] = WH(title=title, company=work_company, is_current=is_current)
+            return work
+        
+        return [
+            PD(
+                external_id=f"mock-{slug}-{i}-{suffix}",
                 full_name=f"{first_name} {last_name}",
-                current_title=current_title,
-                current_company=current_company,
-                location_state=state if isinstance(state, str) else state[0] if state else "CA",
+                current_title=founder_title if is_founder else title,
+                current_company=f"{first_name}'s Startup Inc." if is_founder else company,
+                location_state=effective_state,
                 education=[
-                    EducationData(
-                        institution=random.choice(self.UNIVERSITIES),
+                    ED(
+                        institution=university,
                         graduation_year=graduation_year,
                         degree_type="Bachelor's"
                     )
                 ],
                 work_history=[
-                    WorkHistoryData(
-                        title=current_title,
-                        company=current_company,
-                        is_current=True
+                    _wh(
+                        founder_title if is_founder else title,
+                        f"{first_name}'s Startup Inc." if is_founder else company,
+                        True
                     ),
-                    WorkHistoryData(
-                        title=random.choice(self.TITLES),
-                        company=company,
-                        is_current=False
-                    )
+                    _wh(previous_title, company, False)
                 ]
-            ))
-        
-        return profiles
+            )
+            for i, first_name, last_name, title, founder_title, previous_title, university, is_founder, graduation_year, suffix in zip(
+                range(n), first_names, last_names, titles, founder_titles,
+                previous_titles, universities, founder_flags, graduation_years, suffixes
+            )
+        ]
     
     async def get_profile(self, profile_id: str) -> ProfileData:
         """Get a mock profile by ID."""
-        return ProfileData(
-            external_id=profile_id,
-            full_name="Mock Person",
-            current_title="Software Engineer",
-            current_company="Mock Company",
-            location_state="CA",
-            education=[
-                EducationData(
-                    institution="Stanford University",
-                    graduation_year=2015,
-                    degree_type="Bachelor's"
-                )
-            ],
-            work_history=[]
-        )
+        # Shallow copy: nested education entries are shared with the template
+        return self._PROFILE_TEMPLATE.model_copy(update={"external_id": profile_id})
     
     async def bulk_refresh(self, profile_ids: List[str]) -> List[ProfileData]:
         """Refresh mock profiles - generates new random data."""
-        profiles = []
-        for profile_id in profile_ids:
-            profile = await self.get_profile(profile_id)
-            profiles.append(profile)
-        return profiles
+        return list(await asyncio.gather(*(self.get_profile(pid) for pid in profile_ids)))
 
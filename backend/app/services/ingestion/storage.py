@@ -0,0 +1,130 @@
+"""Persistence of ingested profiles."""
+import uuid
+from typing import List
+from datetime import datetime
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models import Profile, Education, WorkHistory
+from app.models.education import graduation_year_key
+from app.models.work_history import normalize_title
+from app.schemas.profile import ProfileData
+
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Profiles written (and committed) per round-trip
+STORE_BATCH_SIZE = 500
+
+
+def store_profiles(
+    db: Session,
+    profiles: List[ProfileData],
+    batch_size: int = STORE_BATCH_SIZE
+) -> None:
+    """
+    Store or update profiles in the database, committing in batches.
+
+    Profiles are upserted on external_id and education rows are inserted
+    with ON CONFLICT DO NOTHING, so no per-row existence SELECTs are issued.
+    Work history snapshots are appended with multi-row INSERTs. Each batch
+    of `batch_size` profiles is committed on its own.
+
+    Args:
+        db: Database session
+        profiles: Profile data to store
+        batch_size: Number of profiles per INSERT/commit
+    """
+    if not profiles:
+        return
+
+    dialect = db.get_bind().dialect.name
+    try:
+        upsert = _UPSERT_INSERTS[dialect]
+    except KeyError:
+        raise ValueError(f"Unsupported database dialect for ingestion: {dialect}")
+
+    # The same person can be returned for several companies in one run
+    unique_profiles = list({p.external_id: p for p in profiles}.values())
+    snapshot_date = datetime.now()
+
+    for start in range(0, len(unique_profiles), batch_size):
+        _store_batch(db, upsert, unique_profiles[start:start + batch_size], snapshot_date)
+        db.commit()
+
+
+def _store_batch(
+    db: Session,
+    upsert,
+    profiles: List[ProfileData],
+    snapshot_date: datetime
+) -> None:
+    """Write one batch of already de-duplicated profiles and their children."""
+    # Upsert profiles and collect their ids (existing rows keep their id)
+    profile_stmt = upsert(Profile).values([
+        {
+            "id": str(uuid.uuid4()),
+            "external_id": p.external_id,
+            "full_name": p.full_name,
+            "current_title": p.current_title,
+            "current_company": p.current_company,
+            "location_state": p.location_state,
+        }
+        for p in profiles
+    ])
+    profile_stmt = profile_stmt.on_conflict_do_update(
+        index_elements=[Profile.external_id],
+        set_={
+            "full_name": profile_stmt.excluded.full_name,
+            "current_title": profile_stmt.excluded.current_title,
+            "current_company": profile_stmt.excluded.current_company,
+            "location_state": profile_stmt.excluded.location_state,
+            "updated_at": func.now(),
+        },
+    ).returning(Profile.external_id, Profile.id)
+    profile_ids = dict(db.execute(profile_stmt).all())
+
+    # Store education (skip rows already recorded for the profile)
+    education_rows = [
+        {
+            "profile_id": profile_ids[p.external_id],
+            "institution": edu.institution,
+            "graduation_year": edu.graduation_year,
+            "degree_type": edu.degree_type,
+        }
+        for p in profiles
+        for edu in p.education
+    ]
+    if education_rows:
+        db.execute(
+            upsert(Education).values(education_rows).on_conflict_do_nothing(
+                index_elements=[
+                    Education.profile_id,
+                    Education.institution,
+                    graduation_year_key(Education.graduation_year),
+                ]
+            )
+        )
+
+    # Store work history snapshot
+    work_rows = [
+        {
+            "profile_id": profile_ids[p.external_id],
+            "title": work.title,
+            "title_normalized": normalize_title(work.title),
+            "company": work.company,
+            "start_date": work.start_date,
+            "end_date": work.end_date,
+            "is_current": work.is_current,
+            "snapshot_date": snapshot_date,
+        }
+        for p in profiles
+        for work in p.work_history
+    ]
+    if work_rows:
+        db.execute(insert(WorkHistory).values(work_rows))
@@ -1,6 +1,6 @@
 """Notification services package."""
 from app.services.notifications.base import NotificationProvider
-from app.services.notifications.factory import get_notifier
+from app.services.notifications.factory import get_notifier, close_notifiers
 
-__all__ = ["NotificationProvider", "get_notifier"]
+__all__ = ["NotificationProvider", "get_notifier", "close_notifiers"]
 
@@ -1,18 +1,18 @@
-"""Abstract base class for notification providers."""
-from abc import ABC, abstractmethod
-from typing import List
+"""Structural interface for notification providers."""
+from typing import List, Protocol
 from app.models import FounderEvent
 
 
-class NotificationProvider(ABC):
+class NotificationProvider(Protocol):
     """
-    Abstract interface for notification providers.
+    Interface for notification providers.
     
     This abstraction allows swapping between different providers
     (Resend, Slack, webhooks) without changing the rest of the codebase.
+    Providers match it structurally; subclassing it explicitly is optional
+    but inherits the default aclose().
     """
     
-    @abstractmethod
     async def send_founder_digest(self, events: List[FounderEvent]) -> bool:
         """
         Send daily digest of founder transitions.
@@ -23,5 +23,8 @@ class NotificationProvider(ABC):
         Returns:
             True if notification was sent successfully
         """
+        ...
+    
+    async def aclose(self):
+        """Release network resources held by the provider (no-op by default)."""
         pass
-
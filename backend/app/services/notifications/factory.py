@@ -1,14 +1,27 @@
 """Factory for creating notification provider instances."""
-from typing import Optional
+from typing import Callable, Dict, Optional
 from app.services.notifications.base import NotificationProvider
 from app.services.notifications.email import ResendEmailProvider
 from app.config import settings
 
 
+# Notification provider constructors by name. Future providers can be
+# registered here, e.g. "slack": SlackProvider, "webhook": WebhookProvider
+_PROVIDERS: Dict[str, Callable[[], NotificationProvider]] = {
+    "resend": ResendEmailProvider,
+}
+
+# Notifier instances by provider name, shared across requests and scheduled jobs
+_notifiers: Dict[str, NotificationProvider] = {}
+
+
 def get_notifier(provider_name: Optional[str] = None) -> NotificationProvider:
     """
     Factory function to get the appropriate notification provider.
     
+    Instances are cached per resolved provider name so API clients are
+    built once and reused across requests and scheduled jobs.
+    
     Args:
         provider_name: Name of provider (defaults to settings)
         
@@ -20,13 +33,23 @@ def get_notifier(provider_name: Optional[str] = None) -> NotificationProvider:
     """
     provider_name = provider_name or settings.NOTIFICATION_PROVIDER
     
-    if provider_name == "resend":
-        return ResendEmailProvider()
-    # Future providers can be added here:
-    # elif provider_name == "slack":
-    #     return SlackProvider()
-    # elif provider_name == "webhook":
-    #     return WebhookProvider()
-    else:
+    notifier = _notifiers.get(provider_name)
+    if notifier is None:
+        notifier = _notifiers[provider_name] = _create_notifier(provider_name)
+    return notifier
+
+
+def _create_notifier(provider_name: str) -> NotificationProvider:
+    """Construct a new notification provider instance by name."""
+    try:
+        factory = _PROVIDERS[provider_name]
+    except KeyError:
         raise ValueError(f"Unknown notification provider: {provider_name}")
+    return factory()
+
 
+async def close_notifiers():
+    """Close all cached notifiers; call on application shutdown."""
+    for notifier in _notifiers.values():
+        await notifier.aclose()
+    _notifiers.clear()
@@ -0,0 +1,62 @@
+"""Tests for cursor pagination of list endpoints."""
+from datetime import datetime
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.profiles import list_profiles
+from app.schemas.profile import ProfileData
+from app.services.ingestion.storage import store_profiles
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with all tables created."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_profile_cursor_walks_every_page(db):
+    # All rows share one second-resolution updated_at, so only the id
+    # tiebreak separates pages
+    store_profiles(db, [
+        ProfileData(external_id=f"ext-{i}", full_name=f"Person {i}", location_state="CA")
+        for i in range(33)
+    ])
+    
+    seen = []
+    cursor = None
+    for _ in range(10):
+        page = list_profiles(
+            page=1, page_size=10, cursor=cursor, include_total=False, db=db, username="test"
+        )
+        seen.extend(profile.external_id for profile in page.profiles)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    
+    assert cursor is None
+    assert len(seen) == 33
+    assert set(seen) == {f"ext-{i}" for i in range(33)}
+
+
+def test_decode_cursor_rejects_wrong_id_type():
+    cursor = encode_cursor(datetime(2024, 1, 1), "abc")
+    assert decode_cursor(cursor)[1] == "abc"
+    
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, id_type=int)
+    assert exc.value.status_code == 400
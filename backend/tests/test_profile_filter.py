@@ -0,0 +1,33 @@
+"""Tests for profile filtering criteria."""
+import pytest
+from app.schemas.profile import EducationData, ProfileData
+from app.services.filters.profile_filter import ProfileFilter
+
+
+@pytest.mark.parametrize("degree", [
+    "Bachelor's", "Undergraduate", "BS", "B.S.", "BSc", "B.Sc.", "BA", "B.A.",
+    "BBA", "BSBA", "B.Eng", "BE", "BFA", "B.Tech",
+])
+def test_undergrad_degrees_match(degree):
+    assert ProfileFilter._UNDERGRAD_RE.search(degree.lower())
+
+
+@pytest.mark.parametrize("degree", ["MBA", "MS", "MA", "M.Eng", "PhD", "Master's", "Abstract Art"])
+def test_graduate_degrees_do_not_match(degree):
+    assert not ProfileFilter._UNDERGRAD_RE.search(degree.lower())
+
+
+def test_experience_uses_undergrad_year_over_earlier_degrees():
+    profile_filter = ProfileFilter(target_companies=["Acme"], target_states=["CA"])
+    profile = ProfileData(
+        external_id="p1",
+        full_name="Test Person",
+        education=[
+            EducationData(institution="Community College", graduation_year=2000, degree_type="Associate"),
+            EducationData(institution="State University", graduation_year=2020, degree_type="BBA"),
+        ],
+    )
+    
+    # The BBA year (5 years before 2025) decides, not the earlier associate degree
+    assert not profile_filter._matches_experience(profile, current_year=2025)
+    assert profile_filter._matches_experience(profile, current_year=2027)
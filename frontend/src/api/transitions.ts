@@ -16,8 +16,9 @@ export interface FounderEvent {
 export interface TransitionsResponse {
   events: FounderEvent[];
   total: number;
-  page: number;
+  page: number | null;
   page_size: number;
+  next_cursor: string | null;
 }
 
 export const transitionsApi = {